@@ -11,11 +11,204 @@ One-page investment decision sheet with:
 Professional design matching blue corporate theme.
 """
 
-import streamlit as st
+import copy
+import functools
+
 import pandas as pd
 from typing import Dict, Any, List
 
 
+# Static markup for the summary tab, built once at import instead of per render
+_SUMMARY_CSS = """
+<style>
+.summary-header {
+    background: linear-gradient(135deg, #1e88e5 0%, #42a5f5 100%);
+    padding: 20px;
+    border-radius: 10px;
+    margin-bottom: 20px;
+    color: white;
+    text-align: center;
+}
+.bull-card {
+    background: linear-gradient(135deg, #2e7d32 0%, #4caf50 100%);
+    padding: 20px;
+    border-radius: 10px;
+    color: white;
+    height: 100%;
+}
+.bear-card {
+    background: linear-gradient(135deg, #c62828 0%, #f44336 100%);
+    padding: 20px;
+    border-radius: 10px;
+    color: white;
+    height: 100%;
+}
+.metric-card {
+    background: linear-gradient(135deg, #1565c0 0%, #1976d2 100%);
+    padding: 15px;
+    border-radius: 8px;
+    color: white;
+    text-align: center;
+    margin: 5px 0;
+}
+.risk-low { color: #4caf50; font-weight: bold; }
+.risk-moderate { color: #ff9800; font-weight: bold; }
+.risk-high { color: #f44336; font-weight: bold; }
+.valuation-row { display: flex; }
+.valuation-card {
+    flex: 1;
+    padding: 15px;
+    border-radius: 8px;
+    text-align: center;
+    margin: 5px;
+}
+.val-bear { background-color: #ffebee; border: 2px solid #f44336; }
+.val-base { background-color: #e3f2fd; border: 2px solid #1976d2; }
+.val-bull { background-color: #e8f5e9; border: 2px solid #4caf50; }
+.red-flag-item {
+    background-color: #fff3e0;
+    padding: 10px;
+    border-left: 4px solid #ff9800;
+    margin: 5px 0;
+    border-radius: 0 5px 5px 0;
+}
+.green-flag-item {
+    background-color: #e8f5e9;
+    padding: 10px;
+    border-left: 4px solid #4caf50;
+    margin: 5px 0;
+    border-radius: 0 5px 5px 0;
+}
+</style>
+"""
+
+_HEADER_TMPL = """
+<div class="summary-header">
+    <h2>Investment Summary</h2>
+    <h3>{ticker} - {company_name}</h3>
+</div>
+"""
+
+_BULL_CARD_HTML = """
+<div class="bull-card">
+    <h4>Bull Case</h4>
+</div>
+"""
+
+_BEAR_CARD_HTML = """
+<div class="bear-card">
+    <h4>Bear Case</h4>
+</div>
+"""
+
+_RISK_CARD_TMPL = """
+<div style="text-align: center; padding: 10px; background: #f5f5f5; border-radius: 8px;">
+    <div style="font-size: 24px;">{color}</div>
+    <div style="font-weight: bold;">{category}</div>
+    <div class="{css_class}">{level}</div>
+</div>
+"""
+
+# Risk level -> (indicator glyph, CSS class); unknown levels render as MODERATE
+_RISK_STYLE = {
+    'LOW': ("🟢", "risk-low"),
+    'MODERATE': ("🟡", "risk-moderate"),
+    'HIGH': ("🔴", "risk-high"),
+}
+
+# Fragments below are joined into a single st.markdown call, so they carry
+# no blank lines (a blank line would end the markdown HTML block)
+_VAL_CARD_TMPL = """<div class="valuation-card val-{side}">
+    <div style="font-weight: bold; color: {color};">{label}</div>
+    <div style="font-size: 24px; font-weight: bold; color: {color};">${price:,.2f}</div>
+    <div style="color: {color};">({note})</div>
+</div>"""
+
+_RED_FLAG_TMPL = """<div class="red-flag-item">
+    ⚠️ {flag}
+</div>"""
+
+_GREEN_FLAG_TMPL = """<div class="green-flag-item">
+    {flag}
+</div>"""
+
+# Generic points used to fill the bull/bear case up to 3 entries
+_BULL_FALLBACK_POINTS = (
+    "Established market position with brand recognition",
+    "Diversified revenue streams reduce concentration risk",
+    "Experienced management team with track record",
+)
+
+_BEAR_FALLBACK_POINTS = (
+    "Competitive pressure may compress margins over time",
+    "Macroeconomic sensitivity could impact near-term results",
+    "Execution risk in strategic initiatives",
+)
+
+
+def _fmt_big_dollars(value: float) -> str:
+    """Format a dollar amount with B/M suffixes."""
+    if abs(value) >= 1e9:
+        return f"${value/1e9:,.1f}B"
+    elif abs(value) >= 1e6:
+        return f"${value/1e6:,.1f}M"
+    return f"${value:,.0f}"
+
+
+def _fmt_multiple(value: float) -> str:
+    return f"{value:.2f}x"
+
+
+def _fmt_default(value: float) -> str:
+    return f"{value:,.2f}"
+
+
+# Display formatter per key metric; anything not listed uses _fmt_default
+_METRIC_FORMATTERS = {
+    'Current Price': lambda value: f"${value:,.2f}",
+    'Market Cap': _fmt_big_dollars,
+    'Revenue': _fmt_big_dollars,
+    'Net Income': _fmt_big_dollars,
+    'ROE': lambda value: f"{value*100:.1f}%",
+    'P/E Ratio': _fmt_multiple,
+    'Debt/Equity': _fmt_multiple,
+    'Current Ratio': _fmt_multiple,
+}
+
+
+def _pad_points(points: List[str], fallbacks, target: int = 3) -> List[str]:
+    """Append fallback points not already present until target is reached."""
+    needed = target - len(points)
+    if needed > 0:
+        seen = set(points)
+        for fallback in fallbacks:
+            if fallback not in seen:
+                points.append(fallback)
+                needed -= 1
+                if not needed:
+                    break
+    return points[:target]
+
+
+def _memoize_on_instance(method):
+    """
+    Cache a no-argument generator method's result on the instance.
+    
+    The summary sections only depend on the financials passed to
+    __init__, so each one is computed once per generator. A copy is
+    returned so callers can't mutate the cached value.
+    """
+    key = method.__name__
+    
+    @functools.wraps(method)
+    def wrapper(self):
+        if key not in self._cache:
+            self._cache[key] = method(self)
+        return copy.copy(self._cache[key])
+    
+    return wrapper
+
+
 class InvestmentSummaryGenerator:
     """
     Generates intelligent investment summaries based on financial data.
@@ -34,36 +227,63 @@ class InvestmentSummaryGenerator:
         self.ticker = financials.get('ticker', 'N/A')
         self.company_name = financials.get('company_name', 'Unknown Company')
         self.ratios = financials.get('ratios', pd.DataFrame())
-        self.growth_rates = financials.get('growth_rates', {})
+        self._ratio_map = self._build_ratio_map(self.ratios)
+        self.growth_rates = financials.get('growth_rates') or {}
         self.market_data = financials.get('market_data', {})
+        self._cache: Dict[str, Any] = {}
+    
+    @staticmethod
+    def _build_ratio_map(ratios) -> Dict[str, float]:
+        """
+        Flatten the ratios DataFrame into a name -> float dict.
+        
+        Handles both row oriented (ratio names in the index, as produced by
+        the backend) and column oriented frames. Index labels win over column
+        labels. Values that cannot be read as a number are stored as NaN.
+        """
+        ratio_map = {}
+        if ratios is None or ratios.empty:
+            return ratio_map
+        
+        def _to_float(val) -> float:
+            try:
+                return float(val)
+            except (TypeError, ValueError):
+                return float('nan')
+        
+        # Column oriented: first row holds the values
+        first_row = ratios.iloc[0]
+        for name, val in zip(ratios.columns, first_row):
+            ratio_map.setdefault(name, _to_float(val))
+        
+        # Row oriented: first column holds the values
+        seen = set()
+        for name, val in zip(ratios.index, ratios.iloc[:, 0]):
+            if name not in seen:
+                seen.add(name)
+                ratio_map[name] = _to_float(val)
+        
+        return ratio_map
     
     def _get_ratio(self, name: str, default: float = None) -> float:
-        """Safely get a ratio value from the ratios DataFrame."""
-        try:
-            if self.ratios is None or self.ratios.empty:
-                return default
-            
-            # Handle both row and column oriented DataFrames
-            if name in self.ratios.index:
-                val = self.ratios.loc[name]
-                if isinstance(val, pd.Series):
-                    val = val.iloc[0] if len(val) > 0 else default
-                return float(val) if pd.notna(val) else default
-            elif name in self.ratios.columns:
-                val = self.ratios[name].iloc[0] if len(self.ratios) > 0 else default
-                return float(val) if pd.notna(val) else default
-            return default
-        except:
-            return default
+        """Safely get a ratio value, returning default when missing or NaN."""
+        val = self._ratio_map.get(name)
+        # val != val is True only for NaN
+        return default if val is None or val != val else val
     
     def _get_growth_rate(self, name: str, default: float = None) -> float:
         """Safely get a growth rate value."""
+        val = self.growth_rates.get(name)
+        if val is None:
+            return default
         try:
-            val = self.growth_rates.get(name, default)
-            return float(val) if val is not None and pd.notna(val) else default
-        except:
+            val = float(val)
+        except (TypeError, ValueError):
             return default
+        # val != val is True only for NaN
+        return default if val != val else val
     
+    @_memoize_on_instance
     def generate_bull_case(self) -> List[str]:
         """
         Generate 3 bull case points based on positive financial signals.
@@ -110,19 +330,9 @@ class InvestmentSummaryGenerator:
             bull_points.append("Excellent cash generation: Operating cash flow exceeds net income")
         
         # Ensure we have exactly 3 points
-        fallback_points = [
-            "Established market position with brand recognition",
-            "Diversified revenue streams reduce concentration risk",
-            "Experienced management team with track record"
-        ]
-        
-        while len(bull_points) < 3:
-            for fallback in fallback_points:
-                if fallback not in bull_points and len(bull_points) < 3:
-                    bull_points.append(fallback)
-        
-        return bull_points[:3]
+        return _pad_points(bull_points, _BULL_FALLBACK_POINTS)
     
+    @_memoize_on_instance
     def generate_bear_case(self) -> List[str]:
         """
         Generate 3 bear case points based on negative financial signals.
@@ -169,19 +379,9 @@ class InvestmentSummaryGenerator:
                 bear_points.append(f"Low returns: ROE of {roe*100:.1f}% underperforms cost of equity")
         
         # Ensure we have exactly 3 points
-        fallback_points = [
-            "Competitive pressure may compress margins over time",
-            "Macroeconomic sensitivity could impact near-term results",
-            "Execution risk in strategic initiatives"
-        ]
-        
-        while len(bear_points) < 3:
-            for fallback in fallback_points:
-                if fallback not in bear_points and len(bear_points) < 3:
-                    bear_points.append(fallback)
-        
-        return bear_points[:3]
+        return _pad_points(bear_points, _BEAR_FALLBACK_POINTS)
     
+    @_memoize_on_instance
     def assess_risks(self) -> Dict[str, str]:
         """
         Assess risk levels across 5 categories.
@@ -189,69 +389,48 @@ class InvestmentSummaryGenerator:
         Returns:
             Dict with risk categories and levels (LOW, MODERATE, HIGH)
         """
-        risks = {}
-        
-        # Financial Health: Based on Current Ratio + Debt/Equity
+        # Every input has a non-None default, so no None checks are needed below
         current_ratio = self._get_ratio('Current_Ratio', 1.0)
         de_ratio = self._get_ratio('Debt_to_Equity', 1.0)
+        pe_ratio = self._get_ratio('PE_Ratio', 20.0)
+        roe = self._get_ratio('ROE', 0.10)
+        op_margin = self._get_ratio('Operating_Margin', 0.10)
+        rev_cagr = self._get_growth_rate('Total_Revenue_CAGR', 0.05)
         
+        # Financial Health: Based on Current Ratio + Debt/Equity
         if current_ratio >= 1.5 and de_ratio <= 0.5:
-            risks['Financial Health'] = 'LOW'
+            financial_health = 'LOW'
         elif current_ratio < 1.0 or de_ratio > 2.0:
-            risks['Financial Health'] = 'HIGH'
+            financial_health = 'HIGH'
         else:
-            risks['Financial Health'] = 'MODERATE'
+            financial_health = 'MODERATE'
         
         # Valuation: Based on P/E ratio
-        pe_ratio = self._get_ratio('PE_Ratio', 20.0)
-        
-        if pe_ratio is not None:
-            if pe_ratio < 20:
-                risks['Valuation'] = 'LOW'
-            elif pe_ratio > 40:
-                risks['Valuation'] = 'HIGH'
-            else:
-                risks['Valuation'] = 'MODERATE'
-        else:
-            risks['Valuation'] = 'MODERATE'
+        valuation = 'LOW' if pe_ratio < 20 else 'HIGH' if pe_ratio > 40 else 'MODERATE'
         
         # Growth: Based on Revenue CAGR
-        rev_cagr = self._get_growth_rate('Total_Revenue_CAGR', 0.05)
-        
-        if rev_cagr is not None:
-            if rev_cagr > 0.10:
-                risks['Growth'] = 'LOW'
-            elif rev_cagr < 0:
-                risks['Growth'] = 'HIGH'
-            else:
-                risks['Growth'] = 'MODERATE'
-        else:
-            risks['Growth'] = 'MODERATE'
+        growth = 'LOW' if rev_cagr > 0.10 else 'HIGH' if rev_cagr < 0 else 'MODERATE'
         
         # Liquidity: Based on Current Ratio
-        if current_ratio >= 2.0:
-            risks['Liquidity'] = 'LOW'
-        elif current_ratio < 1.0:
-            risks['Liquidity'] = 'HIGH'
-        else:
-            risks['Liquidity'] = 'MODERATE'
+        liquidity = 'LOW' if current_ratio >= 2.0 else 'HIGH' if current_ratio < 1.0 else 'MODERATE'
         
         # Profitability: Based on ROE + Operating Margin
-        roe = self._get_ratio('ROE', 0.10)
-        op_margin = self._get_ratio('Operating_Margin', 0.10)
-        
-        if roe is not None and op_margin is not None:
-            if roe > 0.15 and op_margin > 0.15:
-                risks['Profitability'] = 'LOW'
-            elif roe < 0 or op_margin < 0.05:
-                risks['Profitability'] = 'HIGH'
-            else:
-                risks['Profitability'] = 'MODERATE'
+        if roe > 0.15 and op_margin > 0.15:
+            profitability = 'LOW'
+        elif roe < 0 or op_margin < 0.05:
+            profitability = 'HIGH'
         else:
-            risks['Profitability'] = 'MODERATE'
+            profitability = 'MODERATE'
         
-        return risks
+        return {
+            'Financial Health': financial_health,
+            'Valuation': valuation,
+            'Growth': growth,
+            'Liquidity': liquidity,
+            'Profitability': profitability,
+        }
     
+    @_memoize_on_instance
     def detect_red_flags(self) -> List[str]:
         """
         Detect major red flags in the financial data.
@@ -346,107 +525,42 @@ def render_investment_summary_tab(ticker: str, financials: Dict[str, Any]):
         ticker: Company ticker symbol
         financials: Financial data dictionary
     """
-    
-    # Header with gradient
-    st.markdown("""
-    <style>
-    .summary-header {
-        background: linear-gradient(135deg, #1e88e5 0%, #42a5f5 100%);
-        padding: 20px;
-        border-radius: 10px;
-        margin-bottom: 20px;
-        color: white;
-        text-align: center;
-    }
-    .bull-card {
-        background: linear-gradient(135deg, #2e7d32 0%, #4caf50 100%);
-        padding: 20px;
-        border-radius: 10px;
-        color: white;
-        height: 100%;
-    }
-    .bear-card {
-        background: linear-gradient(135deg, #c62828 0%, #f44336 100%);
-        padding: 20px;
-        border-radius: 10px;
-        color: white;
-        height: 100%;
-    }
-    .metric-card {
-        background: linear-gradient(135deg, #1565c0 0%, #1976d2 100%);
-        padding: 15px;
-        border-radius: 8px;
-        color: white;
-        text-align: center;
-        margin: 5px 0;
-    }
-    .risk-low { color: #4caf50; font-weight: bold; }
-    .risk-moderate { color: #ff9800; font-weight: bold; }
-    .risk-high { color: #f44336; font-weight: bold; }
-    .valuation-card {
-        padding: 15px;
-        border-radius: 8px;
-        text-align: center;
-        margin: 5px;
-    }
-    .val-bear { background-color: #ffebee; border: 2px solid #f44336; }
-    .val-base { background-color: #e3f2fd; border: 2px solid #1976d2; }
-    .val-bull { background-color: #e8f5e9; border: 2px solid #4caf50; }
-    .red-flag-item {
-        background-color: #fff3e0;
-        padding: 10px;
-        border-left: 4px solid #ff9800;
-        margin: 5px 0;
-        border-radius: 0 5px 5px 0;
-    }
-    .green-flag-item {
-        background-color: #e8f5e9;
-        padding: 10px;
-        border-left: 4px solid #4caf50;
-        margin: 5px 0;
-        border-radius: 0 5px 5px 0;
-    }
-    </style>
-    """, unsafe_allow_html=True)
+    # Imported here so the generator can be used without loading Streamlit
+    import streamlit as st
     
     if not financials:
         st.warning("Please extract company data first to view the Investment Summary.")
         return
     
+    # Nothing to summarize until ratios or growth rates have been extracted
+    ratios = financials.get('ratios')
+    if (ratios is None or ratios.empty) and not financials.get('growth_rates'):
+        st.info("No ratios or growth rates available yet. Extract financial ratios to view the Investment Summary.")
+        return
+    
+    st.markdown(_SUMMARY_CSS, unsafe_allow_html=True)
+    
     # Initialize generator
     generator = InvestmentSummaryGenerator(financials)
     company_name = financials.get('company_name', ticker)
     
     # Header
-    st.markdown(f"""
-    <div class="summary-header">
-        <h2>Investment Summary</h2>
-        <h3>{ticker} - {company_name}</h3>
-    </div>
-    """, unsafe_allow_html=True)
+    st.markdown(_HEADER_TMPL.format(ticker=ticker, company_name=company_name), unsafe_allow_html=True)
     
     # Bull/Bear Cases - Side by Side
     col1, col2 = st.columns(2)
     
     with col1:
         bull_case = generator.generate_bull_case()
-        st.markdown("""
-        <div class="bull-card">
-            <h4>Bull Case</h4>
-        </div>
-        """, unsafe_allow_html=True)
-        for point in bull_case:
-            st.markdown(f"• {point}")
+        bull_parts = [_BULL_CARD_HTML]
+        bull_parts.extend(f"• {point}" for point in bull_case)
+        st.markdown("\n\n".join(bull_parts), unsafe_allow_html=True)
     
     with col2:
         bear_case = generator.generate_bear_case()
-        st.markdown("""
-        <div class="bear-card">
-            <h4>Bear Case</h4>
-        </div>
-        """, unsafe_allow_html=True)
-        for point in bear_case:
-            st.markdown(f"• {point}")
+        bear_parts = [_BEAR_CARD_HTML]
+        bear_parts.extend(f"• {point}" for point in bear_case)
+        st.markdown("\n\n".join(bear_parts), unsafe_allow_html=True)
     
     st.markdown("---")
     
@@ -455,26 +569,11 @@ def render_investment_summary_tab(ticker: str, financials: Dict[str, Any]):
     metrics = generator.get_key_metrics()
     
     cols = st.columns(4)
-    metric_items = list(metrics.items())
     
-    for i, (name, value) in enumerate(metric_items):
+    for i, (name, value) in enumerate(metrics.items()):
         with cols[i % 4]:
             if value is not None:
-                if name in ['Current Price']:
-                    display_val = f"${value:,.2f}"
-                elif name in ['Market Cap', 'Revenue', 'Net Income']:
-                    if abs(value) >= 1e9:
-                        display_val = f"${value/1e9:,.1f}B"
-                    elif abs(value) >= 1e6:
-                        display_val = f"${value/1e6:,.1f}M"
-                    else:
-                        display_val = f"${value:,.0f}"
-                elif name in ['ROE']:
-                    display_val = f"{value*100:.1f}%"
-                elif name in ['P/E Ratio', 'Debt/Equity', 'Current Ratio']:
-                    display_val = f"{value:.2f}x"
-                else:
-                    display_val = f"{value:,.2f}"
+                display_val = _METRIC_FORMATTERS.get(name, _fmt_default)(value)
             else:
                 display_val = "N/A"
             
@@ -486,28 +585,14 @@ def render_investment_summary_tab(ticker: str, financials: Dict[str, Any]):
     st.markdown("### Risk Assessment")
     risks = generator.assess_risks()
     
-    risk_cols = st.columns(5)
-    risk_items = list(risks.items())
-    
-    for i, (category, level) in enumerate(risk_items):
-        with risk_cols[i]:
-            if level == 'LOW':
-                color = "🟢"
-                css_class = "risk-low"
-            elif level == 'HIGH':
-                color = "🔴"
-                css_class = "risk-high"
-            else:
-                color = "🟡"
-                css_class = "risk-moderate"
-            
-            st.markdown(f"""
-            <div style="text-align: center; padding: 10px; background: #f5f5f5; border-radius: 8px;">
-                <div style="font-size: 24px;">{color}</div>
-                <div style="font-weight: bold;">{category}</div>
-                <div class="{css_class}">{level}</div>
-            </div>
-            """, unsafe_allow_html=True)
+    risk_cols = st.columns(len(risks))
+    
+    for risk_col, (category, level) in zip(risk_cols, risks.items()):
+        with risk_col:
+            color, css_class = _RISK_STYLE.get(level, _RISK_STYLE['MODERATE'])
+            st.markdown(_RISK_CARD_TMPL.format(
+                color=color, category=category, css_class=css_class, level=level
+            ), unsafe_allow_html=True)
     
     st.markdown("---")
     
@@ -515,34 +600,23 @@ def render_investment_summary_tab(ticker: str, financials: Dict[str, Any]):
     st.markdown("### Valuation Range")
     valuation = generator.calculate_valuation_range()
     
-    val_cols = st.columns(3)
-    
-    with val_cols[0]:
-        st.markdown(f"""
-        <div class="valuation-card val-bear">
-            <div style="font-weight: bold; color: #c62828;">Bear Case</div>
-            <div style="font-size: 24px; font-weight: bold; color: #c62828;">${valuation['bear_case']:,.2f}</div>
-            <div style="color: #c62828;">({valuation['bear_pct']}%)</div>
-        </div>
-        """, unsafe_allow_html=True)
-    
-    with val_cols[1]:
-        st.markdown(f"""
-        <div class="valuation-card val-base">
-            <div style="font-weight: bold; color: #1565c0;">Base Case</div>
-            <div style="font-size: 24px; font-weight: bold; color: #1565c0;">${valuation['base_case']:,.2f}</div>
-            <div style="color: #1565c0;">(Current)</div>
-        </div>
-        """, unsafe_allow_html=True)
-    
-    with val_cols[2]:
-        st.markdown(f"""
-        <div class="valuation-card val-bull">
-            <div style="font-weight: bold; color: #2e7d32;">Bull Case</div>
-            <div style="font-size: 24px; font-weight: bold; color: #2e7d32;">${valuation['bull_case']:,.2f}</div>
-            <div style="color: #2e7d32;">(+{valuation['bull_pct']}%)</div>
-        </div>
-        """, unsafe_allow_html=True)
+    val_parts = [
+        '<div class="valuation-row">',
+        _VAL_CARD_TMPL.format(
+            side="bear", color="#c62828", label="Bear Case",
+            price=valuation['bear_case'], note=f"{valuation['bear_pct']}%"
+        ),
+        _VAL_CARD_TMPL.format(
+            side="base", color="#1565c0", label="Base Case",
+            price=valuation['base_case'], note="Current"
+        ),
+        _VAL_CARD_TMPL.format(
+            side="bull", color="#2e7d32", label="Bull Case",
+            price=valuation['bull_case'], note=f"+{valuation['bull_pct']}%"
+        ),
+        '</div>',
+    ]
+    st.markdown("\n".join(val_parts), unsafe_allow_html=True)
     
     st.markdown("---")
     
@@ -550,19 +624,13 @@ def render_investment_summary_tab(ticker: str, financials: Dict[str, Any]):
     st.markdown("### Red Flags & Concerns")
     red_flags = generator.detect_red_flags()
     
+    flag_parts = []
     for flag in red_flags:
         if flag.startswith("✅"):
-            st.markdown(f"""
-            <div class="green-flag-item">
-                {flag}
-            </div>
-            """, unsafe_allow_html=True)
+            flag_parts.append(_GREEN_FLAG_TMPL.format(flag=flag))
         else:
-            st.markdown(f"""
-            <div class="red-flag-item">
-                ⚠️ {flag}
-            </div>
-            """, unsafe_allow_html=True)
+            flag_parts.append(_RED_FLAG_TMPL.format(flag=flag))
+    st.markdown("\n".join(flag_parts), unsafe_allow_html=True)
     
     st.markdown("---")
     st.caption("Investment Summary generated automatically based on financial data. This is not investment advice.")
@@ -553,6 +553,35 @@ def test_edge_negative_price():
     assert valuation['base_case'] == 0
     assert valuation['bull_case'] == 0
 
+@test("Edge Case: Backend-shaped ratios (with _components dict)")
+def test_edge_backend_ratios():
+    """usa_backend stores a dict under '_components', giving an object cell in the frame"""
+    ratios_dict = {
+        'ROE': 0.20,
+        'Current_Ratio': 1.8,
+        'PE_Ratio': 25.0,
+        '_components': {'revenue': 1000, 'net_income': 200},
+    }
+    mock = {
+        'ticker': 'TEST',
+        'company_name': 'Test Corp',
+        'ratios': pd.DataFrame([ratios_dict]).T,  # Same shape as usa_backend
+        'growth_rates': {'Total_Revenue_CAGR': 0.08},
+    }
+    
+    # Generator should still read the scalar ratios
+    gen = InvestmentSummaryGenerator(mock)
+    assert gen._get_ratio('ROE') == 0.20, f"Expected ROE 0.20, got {gen._get_ratio('ROE')}"
+    assert gen._get_ratio('_components') is None, "Non-numeric cells should read as missing"
+    
+    # Every section the tab renders should run on the object cell without raising
+    gen.generate_bull_case()
+    gen.generate_bear_case()
+    gen.get_key_metrics()
+    gen.assess_risks()
+    gen.calculate_valuation_range()
+    gen.detect_red_flags()
+
 # ==========================================
 # RUN ALL TESTS
 # ==========================================
@@ -604,6 +633,7 @@ def run_all_tests():
     test_edge_missing_roe()
     test_edge_all_missing()
     test_edge_negative_price()
+    test_edge_backend_ratios()
     print()
     
     # Summary
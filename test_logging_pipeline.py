@@ -0,0 +1,376 @@
+"""
+LOGGING PIPELINE - AUTOMATED TESTS
+==================================
+Tests the queued logging pipeline in utils/security.py against a
+temporary log directory (no files are written into the project).
+
+This validates:
+- Routing of records to per-logger files, including child loggers
+- Deduplication and rate limiting
+- Sampling of INFO/DEBUG records and the SecurityLog exemption
+- The single background flush thread
+- Exception tracebacks reaching the log file
+- Size-based rollover through FastRotatingFileHandler.emit_batch
+
+Run: python test_logging_pipeline.py
+"""
+
+import gc
+import logging
+import os
+import sys
+import tempfile
+import threading
+import weakref
+
+# The default loggers are set up at import and write to ./logs, so move into
+# a scratch directory first
+PROJECT_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, PROJECT_DIR)
+LOG_ROOT = tempfile.mkdtemp(prefix="atlas_logs_")
+os.chdir(LOG_ROOT)
+
+import utils.security as atlas_logging
+from utils.security import (
+    EngineLogger, FastRotatingFileHandler, RateLimitDedupFilter, SamplingFilter,
+    get_logger, log_error, log_info, log_warning,
+)
+
+LOG_DIR = os.path.join(LOG_ROOT, "logs")
+
+# Test counter
+tests_run = 0
+tests_passed = 0
+tests_failed = 0
+
+def test(name):
+    """Decorator to track tests"""
+    def decorator(func):
+        def wrapper():
+            global tests_run, tests_passed, tests_failed
+            tests_run += 1
+            try:
+                func()
+                tests_passed += 1
+                print(f"✅ {name}")
+                return True
+            except AssertionError as e:
+                tests_failed += 1
+                print(f"❌ {name}")
+                print(f"   Error: {str(e)}")
+                return False
+            except Exception as e:
+                tests_failed += 1
+                print(f"❌ {name} (Exception)")
+                print(f"   Error: {type(e).__name__}: {str(e)}")
+                return False
+        return wrapper
+    return decorator
+
+def drain():
+    """Wait for the listener to process everything queued, then flush to disk"""
+    atlas_logging._log_queue.join()
+    atlas_logging._flush_buffered_handlers()
+
+def read_log(name):
+    path = os.path.join(LOG_DIR, f"{name.lower()}.log")
+    if not os.path.exists(path):
+        return ""
+    with open(path, encoding='utf-8') as f:
+        return f.read()
+
+def make_record(msg, args=(), level=logging.WARNING, name='FilterTest'):
+    return logging.LogRecord(name, level, __file__, 0, msg, args, None)
+
+# ==========================================
+# TEST SUITE 1: ROUTING
+# ==========================================
+
+@test("Routing: Configured logger writes to its own file only")
+def test_routing_own_file():
+    EngineLogger.setup_logger('RouteA', log_to_console=False, log_dir=LOG_DIR)
+    EngineLogger.setup_logger('RouteB', log_to_console=False, log_dir=LOG_DIR)
+    log_warning("route-a only", logger_name='RouteA')
+    drain()
+
+    assert "route-a only" in read_log('RouteA'), "Record missing from RouteA's file"
+    assert "route-a only" not in read_log('RouteB'), "Record leaked into RouteB's file"
+
+@test("Routing: Unconfigured child logger reaches the parent's file")
+def test_routing_unconfigured_child():
+    logging.getLogger('AtlasEngine.child').warning("orphan child warn")
+    drain()
+
+    assert "orphan child warn" in read_log('AtlasEngine'), \
+        "Child record should propagate to atlasengine.log"
+
+@test("Routing: Configured child writes once to its own file and once to the parent's")
+def test_routing_configured_child():
+    EngineLogger.setup_logger('AtlasEngine.sub', log_to_console=False, log_dir=LOG_DIR)
+    logging.getLogger('AtlasEngine.sub').warning("sub-logger warn")
+    drain()
+
+    own = read_log('AtlasEngine.sub').count("sub-logger warn")
+    parent = read_log('AtlasEngine').count("sub-logger warn")
+    assert own == 1, f"Expected 1 copy in atlasengine.sub.log, got {own}"
+    assert parent == 1, f"Expected 1 copy in atlasengine.log, got {parent}"
+
+@test("Routing: propagate=False keeps a child out of the parent's file")
+def test_routing_no_propagate():
+    child = EngineLogger.setup_logger('RouteA.quiet', log_to_console=False, log_dir=LOG_DIR)
+    child.propagate = False
+    child.warning("non-propagating warn")
+    drain()
+
+    assert "non-propagating warn" in read_log('RouteA.quiet'), "Record missing from its own file"
+    assert "non-propagating warn" not in read_log('RouteA'), "Record should not reach the parent"
+
+@test("Routing: propagate change after the first record takes effect")
+def test_routing_propagate_change():
+    EngineLogger.setup_logger('RouteC', log_to_console=False, log_dir=LOG_DIR)
+    child = EngineLogger.setup_logger('RouteC.late', log_to_console=False, log_dir=LOG_DIR)
+    child.warning("before propagate change")
+    drain()
+    child.propagate = False
+    child.warning("after propagate change")
+    drain()
+
+    parent = read_log('RouteC')
+    assert "before propagate change" in parent, "First record should reach the parent"
+    assert "after propagate change" not in parent, "propagate=False set later was ignored"
+    assert "after propagate change" in read_log('RouteC.late'), "Record missing from its own file"
+
+@test("Routing: Logger configured after its child's records start flowing receives them")
+def test_routing_late_parent():
+    logging.getLogger('LateParent.child').warning("before parent configured")
+    drain()
+    EngineLogger.setup_logger('LateParent', log_to_console=False, log_dir=LOG_DIR)
+    logging.getLogger('LateParent.child').warning("after parent configured")
+    drain()
+
+    assert "after parent configured" in read_log('LateParent'), \
+        "Newly configured parent should receive its child's records"
+
+# ==========================================
+# TEST SUITE 2: DEDUP AND RATE LIMITING
+# ==========================================
+
+@test("Dedup: Repeated message is suppressed within the window")
+def test_dedup_repeat():
+    f = RateLimitDedupFilter(rate=100, window=60)
+    assert f.filter(make_record("disk %s full", ('sda',))), "First record should pass"
+    assert not f.filter(make_record("disk %s full", ('sda',))), "Repeat should be suppressed"
+    assert f.filter(make_record("disk %s full", ('sdb',))), "Different args should pass"
+    assert f.filter(make_record("disk %s full", ('sda',), level=logging.ERROR)), \
+        "Same message at another level should pass"
+
+@test("Dedup: Unhashable args are still deduplicated")
+def test_dedup_unhashable_args():
+    f = RateLimitDedupFilter(rate=100, window=60)
+    assert f.filter(make_record("tickers %s", (['AAPL', 'MSFT'],))), "First record should pass"
+    assert not f.filter(make_record("tickers %s", (['AAPL', 'MSFT'],))), "Repeat should be suppressed"
+
+class _Payload:
+    """Stands in for a large local pinned by a failing call's frame"""
+
+def _failing_call(refs):
+    payload = _Payload()
+    refs.append(weakref.ref(payload))
+    try:
+        raise ValueError("quote feed unavailable")
+    except ValueError as e:
+        log_error("repeat failure", e)
+
+@test("Dedup: Repeated log_error with fresh exceptions is suppressed and not retained")
+def test_dedup_exceptions():
+    refs = []
+    for _ in range(5):
+        _failing_call(refs)
+    drain()
+    gc.collect()
+
+    count = read_log('AtlasEngine').count("repeat failure")
+    assert count == 1, f"Expected 1 copy of the repeated error, got {count}"
+    alive = sum(ref() is not None for ref in refs)
+    assert alive == 0, f"{alive} of {len(refs)} failed calls' locals are still alive"
+
+@test("Rate limit: WARNING is throttled once the bucket is empty, ERROR is not")
+def test_rate_limit():
+    f = RateLimitDedupFilter(rate=5, window=60)
+    passed = sum(f.filter(make_record(f"burst {i}")) for i in range(50))
+    assert passed <= 6, f"Expected about 5 records through the bucket, got {passed}"
+    assert f.filter(make_record("error after burst", level=logging.ERROR)), \
+        "ERROR should bypass the rate limit"
+
+@test("Dedup: Malformed format args do not raise into the caller")
+def test_malformed_args():
+    previous = logging.raiseExceptions
+    # The listener reports the bad record through handleError; keep stderr quiet
+    logging.raiseExceptions = False
+    try:
+        get_logger().warning('%d items', 'abc')
+        drain()
+    finally:
+        logging.raiseExceptions = previous
+
+# ==========================================
+# TEST SUITE 3: SAMPLING
+# ==========================================
+
+@test("Sampling: 1 in info_n INFO records is kept, WARNING always")
+def test_sampling_ratio():
+    f = SamplingFilter(info_n=10, debug_n=100)
+    kept = sum(f.filter(make_record("tick", level=logging.INFO)) for _ in range(100))
+    assert kept == 10, f"Expected 10 of 100 INFO records, got {kept}"
+    assert all(f.filter(make_record("warn")) for _ in range(20)), "WARNING should never be sampled"
+
+@test("Sampling: Counters are kept per logger")
+def test_sampling_per_logger():
+    f = SamplingFilter(info_n=10, debug_n=100)
+    for _ in range(5):
+        f.filter(make_record("noise", level=logging.INFO, name='Noisy'))
+    assert f.filter(make_record("first", level=logging.INFO, name='Quiet')), \
+        "First INFO from another logger should be kept"
+
+@test("Sampling: SecurityLog INFO events are exempt")
+def test_sampling_security_exempt():
+    for i in range(25):
+        log_info(f"background info {i}")
+    EngineLogger.log_security_event("AUDIT_EVT", "info details", "info")
+    drain()
+
+    assert "[AUDIT_EVT] info details" in read_log('SecurityLog'), \
+        "SecurityLog INFO event should never be sampled out"
+
+# ==========================================
+# TEST SUITE 4: FLUSH THREAD
+# ==========================================
+
+@test("Flush: One daemon flush thread, no re-armed timers")
+def test_flush_single_thread():
+    flushers = [t for t in threading.enumerate() if t.name == "AtlasLogFlush"]
+    timers = [t for t in threading.enumerate() if isinstance(t, threading.Timer)]
+    assert len(flushers) == 1, f"Expected 1 flush thread, found {len(flushers)}"
+    assert flushers[0].daemon, "Flush thread should be a daemon"
+    assert not timers, f"Found {len(timers)} Timer threads"
+    assert not atlas_logging._flush_stop.is_set(), "Flush loop should still be running"
+
+# ==========================================
+# TEST SUITE 5: TRACEBACKS AND ROLLOVER
+# ==========================================
+
+@test("Tracebacks: log_error writes the exception traceback")
+def test_error_traceback():
+    try:
+        1 / 0
+    except ZeroDivisionError as e:
+        log_error("ratio computation failed", e)
+    drain()
+
+    content = read_log('AtlasEngine')
+    assert "ratio computation failed" in content, "Error message missing"
+    assert "Traceback" in content, "Traceback missing"
+    assert "ZeroDivisionError" in content, "Exception type missing"
+
+@test("Rollover: emit_batch rotates files and respects maxBytes")
+def test_rollover_emit_batch():
+    max_bytes = 1000
+    # ASCII and multi-byte payloads: maxBytes counts bytes, not characters
+    for label, payload in (("ascii", "x" * 80), ("non-ascii", "✅ ⚠️ é " * 10)):
+        roll_dir = tempfile.mkdtemp(prefix="atlas_roll_", dir=LOG_ROOT)
+        path = os.path.join(roll_dir, "roll.log")
+        handler = FastRotatingFileHandler(path, maxBytes=max_bytes, backupCount=2, encoding='utf-8')
+        handler.setFormatter(logging.Formatter('%(message)s'))
+        try:
+            records = [make_record("record %03d " % i + payload, name='RollTest') for i in range(40)]
+            handler.emit_batch(records[:20])
+            handler.emit_batch(records[20:])
+        finally:
+            handler.close()
+
+        for suffix in ("", ".1", ".2"):
+            assert os.path.exists(path + suffix), f"{label}: roll.log{suffix} missing"
+            size = os.path.getsize(path + suffix)
+            assert size <= max_bytes, f"{label}: roll.log{suffix} is {size} bytes, over maxBytes"
+        assert not os.path.exists(path + ".3"), f"{label}: backupCount=2 should keep only two backups"
+        with open(path, encoding='utf-8') as f:
+            current = f.read()
+        assert "record 039" in current, f"{label}: last record should be in the current file"
+
+@test("Rollover: Size counts encoded bytes and newline translation")
+def test_rollover_encoded_len():
+    roll_dir = tempfile.mkdtemp(prefix="atlas_roll_", dir=LOG_ROOT)
+    handler = FastRotatingFileHandler(os.path.join(roll_dir, "len.log"), maxBytes=1000, encoding='utf-8')
+    try:
+        handler.stream = handler.stream or handler._open()
+        assert handler._encoded_len("abc\n") == 4 + handler._newline_extra, "ASCII length wrong"
+        assert handler._encoded_len("é✅") == 5, "UTF-8 length should be 2 + 3 bytes"
+        # Simulate Windows text mode, where each "\n" is written as "\r\n"
+        handler._newline_extra = 1
+        assert handler._encoded_len("é\n") == 4, "Newline translation not counted"
+    finally:
+        handler.close()
+
+# ==========================================
+# RUN ALL TESTS
+# ==========================================
+
+def run_all_tests():
+    print("="*60)
+    print("LOGGING PIPELINE - AUTOMATED TESTS")
+    print("="*60)
+    print(f"Log directory: {LOG_DIR}")
+    print()
+
+    print("🧭 Testing Routing...")
+    test_routing_own_file()
+    test_routing_unconfigured_child()
+    test_routing_configured_child()
+    test_routing_no_propagate()
+    test_routing_propagate_change()
+    test_routing_late_parent()
+    print()
+
+    print("🔁 Testing Dedup and Rate Limiting...")
+    test_dedup_repeat()
+    test_dedup_unhashable_args()
+    test_dedup_exceptions()
+    test_rate_limit()
+    test_malformed_args()
+    print()
+
+    print("🎲 Testing Sampling...")
+    test_sampling_ratio()
+    test_sampling_per_logger()
+    test_sampling_security_exempt()
+    print()
+
+    print("💾 Testing Flush Thread...")
+    test_flush_single_thread()
+    print()
+
+    print("🔄 Testing Tracebacks and Rollover...")
+    test_error_traceback()
+    test_rollover_emit_batch()
+    test_rollover_encoded_len()
+    print()
+
+    # Summary
+    print("="*60)
+    print("TEST SUMMARY")
+    print("="*60)
+    print(f"Tests Run:    {tests_run}")
+    print(f"Tests Passed: {tests_passed} ✅")
+    print(f"Tests Failed: {tests_failed} ❌")
+    print()
+
+    if tests_failed == 0:
+        print("🎉 ALL TESTS PASSED")
+        return 0
+    else:
+        print("❌ SOME TESTS FAILED - Review errors above")
+        return 1
+
+if __name__ == "__main__":
+    exit_code = run_all_tests()
+    sys.exit(exit_code)
@@ -2,17 +2,507 @@
 CENTRALIZED LOGGING MODULE
 """
 
+import atexit
+import copy
+import itertools
 import logging
 import os
-from logging.handlers import RotatingFileHandler
+import queue
+import stat
+import threading
+import time
+import weakref
+from collections.abc import Mapping
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
 from pathlib import Path
-from typing import Optional
+from typing import Dict, List, Optional
 import warnings
 warnings.filterwarnings('ignore')
 
 
+# Loggers only enqueue records; one listener thread owns the real handlers
+_log_queue: "queue.Queue[logging.LogRecord]" = queue.Queue(maxsize=10000)
+_listener: Optional[QueueListener] = None
+_listener_lock = threading.Lock()
+
+# File handlers holding buffered output, flushed by a background thread
+_FLUSH_INTERVAL = 5.0
+_buffered_handlers: "weakref.WeakSet[logging.Handler]" = weakref.WeakSet()
+_flush_stop = threading.Event()
+
+# Severity names accepted by log_security_event; unknown names log as WARNING
+_SEV_LEVELS = {
+    "debug": logging.DEBUG,
+    "info": logging.INFO,
+    "warning": logging.WARNING,
+    "error": logging.ERROR,
+    "critical": logging.CRITICAL,
+}
+
+# Configured loggers by name, shared with EngineLogger._loggers
+_LOGGER_CACHE: Dict[str, logging.Logger] = {}
+
+
+class _NoCallerLogger(logging.Logger):
+    """
+    Logger that skips the stack walk in findCaller.
+    
+    The Atlas log format never prints pathname, lineno or funcName, so the
+    record gets the same placeholders logging uses when source info is off.
+    """
+    
+    def findCaller(self, stack_info=False, stacklevel=1):
+        return "(unknown file)", 0, "(unknown function)", None
+
+
+class CachedSecondFormatter(logging.Formatter):
+    """
+    Formatter that renders the timestamp once per second instead of per record.
+    
+    Records are formatted on the single listener thread, so the cache needs
+    no lock.
+    """
+    
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._last_sec = None
+        self._last_str = ""
+    
+    def formatTime(self, record, datefmt=None):
+        datefmt = datefmt or self.datefmt
+        if not datefmt:
+            return super().formatTime(record, datefmt)
+        sec = int(record.created)
+        if sec != self._last_sec:
+            self._last_str = time.strftime(datefmt, self.converter(sec))
+            self._last_sec = sec
+        return self._last_str
+
+
+class FastRotatingFileHandler(RotatingFileHandler):
+    """
+    RotatingFileHandler tuned for the listener thread.
+    
+    Writes go through a 64KB buffer and are flushed only for ERROR and above,
+    by the periodic flush thread, or on close. The file size is tracked in
+    the handler, so the rollover check needs neither a stat nor a seek/tell
+    (which would force the buffer out) per record. Sizes are counted in
+    encoded bytes, including the newline translation text mode applies.
+    """
+    
+    buffer_size = 64 * 1024
+    
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        _buffered_handlers.add(self)
+    
+    def _open(self):
+        stream = self._builtin_open(self.baseFilename, self.mode, buffering=self.buffer_size,
+                                    encoding=self.encoding, errors=self.errors)
+        st = os.fstat(stream.fileno())
+        self._is_regular_file = stat.S_ISREG(st.st_mode)
+        self._size = st.st_size
+        self._encoding = stream.encoding
+        self._errors = stream.errors
+        # For ASCII-compatible encodings an ASCII message is one byte per char
+        self._ascii_compatible = "\n".encode(self._encoding) == b"\n"
+        # Text mode writes os.linesep for every "\n" (e.g. "\r\n" on Windows)
+        self._newline_extra = len(os.linesep) - 1
+        return stream
+    
+    def _encoded_len(self, msg: str) -> int:
+        if self._ascii_compatible and msg.isascii():
+            size = len(msg)
+        else:
+            size = len(msg.encode(self._encoding, self._errors))
+        if self._newline_extra:
+            size += self._newline_extra * msg.count("\n")
+        return size
+    
+    def _would_overflow(self, size: int) -> bool:
+        # Never roll over anything other than regular files (bpo-45401)
+        return self._is_regular_file and 0 < self.maxBytes <= self._size + size
+    
+    def shouldRollover(self, record):
+        if self.stream is None:
+            self.stream = self._open()
+        return self._would_overflow(self._encoded_len("%s\n" % self.format(record)))
+    
+    def emit(self, record):
+        self._write_records((record,))
+    
+    def emit_batch(self, records):
+        """Write several records with one lock acquire and one write() call."""
+        self.acquire()
+        try:
+            self._write_records(records)
+        finally:
+            self.release()
+    
+    def _write_records(self, records):
+        parts = []
+        flush = False
+        record = None
+        try:
+            if self.stream is None:
+                self.stream = self._open()
+            for record in records:
+                try:
+                    msg = self.format(record) + self.terminator
+                    size = self._encoded_len(msg)
+                except RecursionError:
+                    raise
+                except Exception:
+                    self.handleError(record)
+                    continue
+                if self._would_overflow(size):
+                    if parts:
+                        self.stream.write("".join(parts))
+                        parts = []
+                    self.doRollover()
+                    if self.stream is None:
+                        self.stream = self._open()
+                parts.append(msg)
+                self._size += size
+                flush = flush or record.levelno >= logging.ERROR
+            if parts:
+                self.stream.write("".join(parts))
+            if flush:
+                self.stream.flush()
+        except RecursionError:
+            raise
+        except Exception:
+            self.handleError(record)
+
+
+def _flush_buffered_handlers():
+    for handler in list(_buffered_handlers):
+        handler.flush()
+
+
+def _flush_loop():
+    while not _flush_stop.wait(_FLUSH_INTERVAL):
+        _flush_buffered_handlers()
+
+
+def _start_flush_thread():
+    thread = threading.Thread(target=_flush_loop, name="AtlasLogFlush", daemon=True)
+    thread.start()
+
+
+class SamplingFilter(logging.Filter):
+    """
+    Keep every WARNING and above, but only 1 in info_n INFO records and
+    1 in debug_n DEBUG records. Counters are kept per logger, so the first
+    record of each level from each logger is kept. Loggers named in exempt
+    (and their children) are never sampled.
+    """
+    
+    def __init__(self, info_n: int = 10, debug_n: int = 100, exempt=("SecurityLog",)):
+        super().__init__()
+        self.info_n = max(1, info_n)
+        self.debug_n = max(1, debug_n)
+        self.exempt = tuple(exempt)
+        self._exempt_prefixes = tuple(name + "." for name in self.exempt)
+        # next() on itertools.count and dict.setdefault are atomic under the GIL
+        self._counts: Dict[tuple, "itertools.count"] = {}
+    
+    def filter(self, record):
+        levelno = record.levelno
+        if levelno >= logging.WARNING:
+            return True
+        if levelno == logging.INFO:
+            n = self.info_n
+        elif levelno == logging.DEBUG:
+            n = self.debug_n
+        else:
+            return True
+        name = record.name
+        if name in self.exempt or name.startswith(self._exempt_prefixes):
+            return True
+        key = (name, levelno)
+        counter = self._counts.get(key)
+        if counter is None:
+            counter = self._counts.setdefault(key, itertools.count())
+        return next(counter) % n == 0
+
+
+# Argument types kept as-is in dedup keys: hashable by value, no references out
+_KEY_SCALARS = (str, int, float, bool, type(None), bytes)
+
+
+def _env_int(name: str, default: int) -> int:
+    try:
+        return int(os.environ.get(name, default))
+    except ValueError:
+        return default
+
+
+class RateLimitDedupFilter(logging.Filter):
+    """
+    Token-bucket rate limit plus suppression of repeated messages.
+    
+    Runs in the calling thread (on the queue handler), so rejected records
+    are never enqueued. ERROR and above bypass the rate limit but are still
+    deduplicated.
+    """
+    
+    _MAX_TRACKED = 1024
+    
+    def __init__(self, rate: float = 1000, window: float = 5.0):
+        super().__init__()
+        self.rate = rate
+        self.window = window
+        self.tokens = rate
+        self.last = time.monotonic()
+        self.seen: Dict[tuple, float] = {}
+        self._lock = threading.Lock()
+    
+    @staticmethod
+    def _arg_key(arg):
+        if isinstance(arg, _KEY_SCALARS):
+            return arg
+        # Exceptions hash by identity and pin their traceback frames; key them
+        # by value so repeats dedup and nothing outlives the call
+        if isinstance(arg, BaseException):
+            return (type(arg).__name__, str(arg))
+        return repr(arg)
+    
+    def _make_key(self, record):
+        # Key on the unformatted message: getMessage() here would run outside
+        # the handler's error handling and raise into the caller on bad args.
+        # The key must hold no references to the caller's objects.
+        msg = record.msg if isinstance(record.msg, str) else repr(record.msg)
+        args = record.args
+        if not args:
+            args_key = ()
+        elif isinstance(args, Mapping):
+            args_key = tuple((k, self._arg_key(v)) for k, v in args.items())
+        else:
+            args_key = tuple(self._arg_key(a) for a in args)
+        return (record.name, record.levelno, msg, args_key)
+    
+    def filter(self, record):
+        try:
+            key = self._make_key(record)
+        except Exception:
+            # An arg whose str/repr raises; let it through undeduplicated
+            key = None
+        with self._lock:
+            now = time.monotonic()
+            if record.levelno < logging.ERROR:
+                self.tokens = min(self.rate, self.tokens + (now - self.last) * self.rate)
+                self.last = now
+                if self.tokens < 1:
+                    return False
+                self.tokens -= 1
+            
+            if key is None:
+                return True
+            prev = self.seen.get(key)
+            if prev is not None and now - prev < self.window:
+                return False
+            if len(self.seen) >= self._MAX_TRACKED:
+                self.seen = {k: t for k, t in self.seen.items() if now - t < self.window}
+                if len(self.seen) >= self._MAX_TRACKED:
+                    self.seen.clear()
+            self.seen[key] = now
+            return True
+
+
+# One formatter for every handler; only the listener thread formats records
+_SHARED_FORMATTER = CachedSecondFormatter(
+    fmt='%(asctime)s | %(name)s | %(levelname)s | %(message)s',
+    datefmt='%Y-%m-%d %H:%M:%S'
+)
+
+
+class _DroppingQueueHandler(QueueHandler):
+    """
+    QueueHandler shared by every Atlas logger. Drops records instead of
+    erroring when the queue is full.
+    """
+    
+    def handle(self, record):
+        # A record propagating through several configured loggers reaches this
+        # same handler once per logger; enqueue (and filter) it only once. The
+        # listener routes it to every logger on its propagation path.
+        if record.__dict__.get('_atlas_queued'):
+            return False
+        record._atlas_queued = True
+        return super().handle(record)
+    
+    def prepare(self, record):
+        # Merge msg and args but keep exc_info, so the traceback is formatted
+        # on the listener thread rather than in the caller. The queue is
+        # in-process, so the record never needs to be pickled.
+        record = copy.copy(record)
+        record.msg = record.getMessage()
+        record.args = None
+        return record
+    
+    def enqueue(self, record):
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            pass
+
+
+class _RoutingHandler(logging.Handler):
+    """
+    Listener-side handler that sends each record to the handlers of every
+    configured logger it would have propagated through: its own logger if
+    configured, then each configured ancestor, stopping at propagate=False.
+    
+    Routes are resolved per record (or once per name within a batch) rather
+    than cached, so loggers configured later and propagate changes apply to
+    the next record. The walk is only a few dict lookups.
+    """
+    
+    def __init__(self):
+        super().__init__()
+        self.routes: Dict[str, List[logging.Handler]] = {}
+    
+    def register(self, name: str, handlers: List[logging.Handler]):
+        self.routes[name] = handlers
+    
+    def handlers_for(self, name: str) -> List[logging.Handler]:
+        handlers = []
+        logger_dict = logging.Logger.manager.loggerDict
+        current = name
+        while current:
+            handlers.extend(self.routes.get(current, ()))
+            # PlaceHolder entries have no propagate attribute and never stop propagation
+            if not getattr(logger_dict.get(current), 'propagate', True):
+                break
+            current = current.rpartition('.')[0]
+        return handlers
+    
+    def handle(self, record):
+        for handler in self.handlers_for(record.name):
+            if record.levelno >= handler.level:
+                handler.handle(record)
+        return True
+    
+    def emit(self, record):
+        self.handle(record)
+    
+    def handle_batch(self, records):
+        per_handler: Dict[logging.Handler, List[logging.LogRecord]] = {}
+        resolved: Dict[str, List[logging.Handler]] = {}
+        for record in records:
+            handlers = resolved.get(record.name)
+            if handlers is None:
+                handlers = resolved[record.name] = self.handlers_for(record.name)
+            for handler in handlers:
+                if record.levelno >= handler.level and handler.filter(record):
+                    per_handler.setdefault(handler, []).append(record)
+        
+        for handler, batch in per_handler.items():
+            emit_batch = getattr(handler, 'emit_batch', None)
+            if emit_batch is not None:
+                emit_batch(batch)
+                continue
+            handler.acquire()
+            try:
+                for record in batch:
+                    handler.emit(record)
+            finally:
+                handler.release()
+
+
+class BatchingQueueListener(QueueListener):
+    """
+    QueueListener that drains up to a batch of records per wakeup.
+    
+    The batch limit adapts: it doubles while the queue keeps filling whole
+    batches and halves when a drain comes up short, so a quiet queue still
+    handles each record promptly.
+    """
+    
+    min_batch = 16
+    max_batch = 512
+    
+    def handle_batch(self, records):
+        for handler in self.handlers:
+            handle_batch = getattr(handler, 'handle_batch', None)
+            if handle_batch is not None:
+                handle_batch(records)
+            else:
+                for record in records:
+                    if not self.respect_handler_level or record.levelno >= handler.level:
+                        handler.handle(record)
+    
+    def _monitor(self):
+        q = self.queue
+        has_task_done = hasattr(q, 'task_done')
+        limit = self.min_batch
+        while True:
+            try:
+                batch = [self.dequeue(True)]
+            except queue.Empty:
+                break
+            while len(batch) < limit:
+                try:
+                    batch.append(q.get_nowait())
+                except queue.Empty:
+                    break
+            
+            stop = False
+            records = []
+            for record in batch:
+                if record is self._sentinel:
+                    stop = True
+                else:
+                    records.append(self.prepare(record))
+            if records:
+                self.handle_batch(records)
+            size = len(batch)
+            # Don't pin the last batch (and any exc_info tracebacks) while idle;
+            # drop it before task_done so join() never returns ahead of this
+            batch = records = record = None
+            if has_task_done:
+                for _ in range(size):
+                    q.task_done()
+            if stop:
+                break
+            
+            if size >= limit:
+                limit = min(limit * 2, self.max_batch)
+            else:
+                limit = max(limit // 2, self.min_batch)
+
+
+_router = _RoutingHandler()
+_queue_handler = _DroppingQueueHandler(_log_queue)
+# Sampling runs first so dropped INFO/DEBUG records never touch the rate limiter
+_queue_handler.addFilter(SamplingFilter(
+    info_n=_env_int("ATLAS_INFO_SAMPLE", 10),
+    debug_n=_env_int("ATLAS_DEBUG_SAMPLE", 100),
+))
+_queue_handler.addFilter(RateLimitDedupFilter())
+
+
+def _shutdown():
+    _flush_stop.set()
+    _listener.stop()
+
+
+def _ensure_listener():
+    global _listener
+    if _listener is not None:
+        return
+    with _listener_lock:
+        if _listener is None:
+            _listener = BatchingQueueListener(_log_queue, _router)
+            _listener.start()
+            _start_flush_thread()
+            # Runs before logging.shutdown, which then flushes and closes the handlers
+            atexit.register(_shutdown)
+
+
 class EngineLogger:
-    _loggers = {}
+    _loggers = _LOGGER_CACHE
     
     @staticmethod
     def setup_logger(name: str = "AtlasEngine", log_level: str = "INFO", 
@@ -22,32 +512,37 @@ class EngineLogger:
             return EngineLogger._loggers[name]
         
         logger = logging.getLogger(name)
+        # Swap the class on this logger only; setLoggerClass would affect every library
+        if type(logger) is logging.Logger:
+            logger.__class__ = _NoCallerLogger
         logger.setLevel(getattr(logging, log_level.upper(), logging.INFO))
         
         if logger.hasHandlers():
             logger.handlers.clear()
         
-        formatter = logging.Formatter(
-            fmt='%(asctime)s | %(name)s | %(levelname)s | %(message)s',
-            datefmt='%Y-%m-%d %H:%M:%S'
-        )
+        handlers = []
         
         if log_to_file:
             log_path = Path(log_dir)
-            log_path.mkdir(parents=True, exist_ok=True)
+            if not log_path.is_dir():
+                log_path.mkdir(parents=True, exist_ok=True)
             log_file = log_path / f"{name.lower()}.log"
-            file_handler = RotatingFileHandler(
+            file_handler = FastRotatingFileHandler(
                 filename=log_file, maxBytes=10*1024*1024, backupCount=5, encoding='utf-8'
             )
             file_handler.setLevel(logging.DEBUG)
-            file_handler.setFormatter(formatter)
-            logger.addHandler(file_handler)
+            file_handler.setFormatter(_SHARED_FORMATTER)
+            handlers.append(file_handler)
         
         if log_to_console:
             console_handler = logging.StreamHandler()
             console_handler.setLevel(logging.WARNING)
-            console_handler.setFormatter(formatter)
-            logger.addHandler(console_handler)
+            console_handler.setFormatter(_SHARED_FORMATTER)
+            handlers.append(console_handler)
+        
+        _router.register(name, handlers)
+        _ensure_listener()
+        logger.addHandler(_queue_handler)
         
         EngineLogger._loggers[name] = logger
         return logger
@@ -60,25 +555,37 @@ class EngineLogger:
     
     @staticmethod
     def log_security_event(event_type: str, details: str, severity: str = "WARNING"):
-        logger = EngineLogger.get_logger("SecurityLog")
-        log_method = getattr(logger, severity.lower(), logger.warning)
-        log_method(f"[{event_type}] {details}")
+        level = _SEV_LEVELS.get(severity.lower(), logging.WARNING)
+        if _SEC_LOGGER.isEnabledFor(level):
+            _SEC_LOGGER.log(level, "[%s] %s", event_type, details)
 
 
 def get_logger(name: str = "AtlasEngine") -> logging.Logger:
-    return EngineLogger.get_logger(name)
+    logger = _LOGGER_CACHE.get(name)
+    return logger if logger is not None else EngineLogger.setup_logger(name)
 
 def log_error(message: str, exception: Optional[Exception] = None, logger_name: str = "AtlasEngine"):
-    logger = EngineLogger.get_logger(logger_name)
-    if exception:
-        logger.error(f"{message}: {str(exception)}", exc_info=True)
+    logger = _LOGGER_CACHE.get(logger_name) or EngineLogger.setup_logger(logger_name)
+    if not logger.isEnabledFor(logging.ERROR):
+        return
+    if exception is not None:
+        logger.error("%s: %s", message, exception, exc_info=exception)
     else:
         logger.error(message)
 
 def log_warning(message: str, logger_name: str = "AtlasEngine"):
-    logger = EngineLogger.get_logger(logger_name)
-    logger.warning(message)
+    logger = _LOGGER_CACHE.get(logger_name) or EngineLogger.setup_logger(logger_name)
+    if logger.isEnabledFor(logging.WARNING):
+        logger.warning(message)
 
 def log_info(message: str, logger_name: str = "AtlasEngine"):
-    logger = EngineLogger.get_logger(logger_name)
-    logger.info(message)
+    logger = _LOGGER_CACHE.get(logger_name) or EngineLogger.setup_logger(logger_name)
+    if logger.isEnabledFor(logging.INFO):
+        logger.info(message)
+
+
+# Set up the default and security loggers at import so the log directory,
+# the open file streams and the listener thread are ready before the first
+# log call, and log_security_event never has to look its logger up
+_default_logger = EngineLogger.setup_logger()
+_SEC_LOGGER = EngineLogger.setup_logger("SecurityLog")